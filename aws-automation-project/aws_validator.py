@@ -5,15 +5,51 @@ Validates AWS resource deployment using boto3 after Terraform apply.
 Checks EC2 instance and ALB, and stores validation data as a JSON file.
 """
 
-import boto3
 import json
 import logging
 import os
-from botocore.exceptions import ClientError
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
+
+_GENERATED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "generated")
+
+# Upper bound on instance IDs sent in a single DescribeInstances request
+MAX_INSTANCE_IDS_PER_CALL = 500
+
+# Matches the instance IDs listed in an InvalidInstanceID.NotFound error message
+_INSTANCE_ID_RE = re.compile(r"\bi-[0-9a-f]+\b")
+
+@lru_cache(maxsize=None)
+def _client(service, region):
+    """
+    Returns a boto3 client for the service and region, reusing it across calls.
+    boto3 is imported here rather than at module level because it is slow to load.
+    """
+    import boto3
+    return boto3.client(service, region_name=region)
+
+def parse_terraform_outputs(raw_json):
+    """
+    Parses the JSON printed by 'terraform output -json' into a flat dict.
+    Args:
+        raw_json (str): Output of 'terraform output -json'.
+    Returns:
+        dict: Output keys and values.
+    """
+    outputs = json.loads(raw_json)
+    return {k: v['value'] for k, v in outputs.items()}
 
 def get_terraform_outputs(generated_dir):
     """
     Retrieves Terraform outputs as a dict from the specified directory.
+    Only needed when running the validator standalone; main.py reuses the
+    outputs already captured by run_terraform.
     Args:
         generated_dir (str): Directory where Terraform files are located.
     Returns:
@@ -28,24 +64,103 @@ def get_terraform_outputs(generated_dir):
             capture_output=True,
             text=True
         )
-        outputs = json.loads(result.stdout)
-        return {k: v['value'] for k, v in outputs.items()}
+        return parse_terraform_outputs(result.stdout)
     except Exception as e:
         logging.error(f"Failed to get terraform outputs: {e}")
         return {}
 
-def validate_aws_resources(instance_id, lb_dns_name, region="us-east-2"):
+def _describe_instance_chunk(ec2, chunk, instances):
+    """
+    Describes one batch of instances into the instances dict.
+    DescribeInstances rejects the whole batch if any ID does not exist, so the
+    missing IDs named in the error are dropped (or the batch is split when
+    they cannot be identified) and the rest is retried.
+    """
+    from botocore.exceptions import ClientError
+    try:
+        resp = ec2.describe_instances(InstanceIds=chunk)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") != "InvalidInstanceID.NotFound":
+            raise
+        missing = set(_INSTANCE_ID_RE.findall(e.response["Error"].get("Message", "")))
+        remaining = [instance_id for instance_id in chunk if instance_id not in missing]
+        if len(remaining) < len(chunk):
+            if remaining:
+                _describe_instance_chunk(ec2, remaining, instances)
+        elif len(chunk) > 1:
+            middle = len(chunk) // 2
+            _describe_instance_chunk(ec2, chunk[:middle], instances)
+            _describe_instance_chunk(ec2, chunk[middle:], instances)
+        return
+
+    for reservation in resp.get("Reservations", []):
+        for instance in reservation.get("Instances", []):
+            instances[instance["InstanceId"]] = instance
+
+def _describe_instances(ec2, instance_ids):
+    """
+    Describes the given instances with one DescribeInstances call per batch of IDs.
+    IDs that do not exist are left out of the result.
+    Returns:
+        dict: Instances keyed by InstanceId.
+    """
+    instances = {}
+    for i in range(0, len(instance_ids), MAX_INSTANCE_IDS_PER_CALL):
+        _describe_instance_chunk(ec2, instance_ids[i:i + MAX_INSTANCE_IDS_PER_CALL], instances)
+    return instances
+
+def _instance_result(instance_id, instance):
+    """
+    Extracts the validation fields for a described instance and logs its state.
+    Returns:
+        dict: instance_id, instance_state and public_ip (all None if not found).
+    """
+    result = {"instance_id": None, "instance_state": None, "public_ip": None}
+    if not instance:
+        logging.error(f"Instance {instance_id} not found.")
+        return result
+
+    result["instance_id"] = instance.get("InstanceId")
+    result["instance_state"] = instance.get("State", {}).get("Name")
+    result["public_ip"] = instance.get("PublicIpAddress")
+    if result["instance_state"] != "running":
+        logging.warning(f"Instance {instance_id} is in state: {result['instance_state']} (expected 'running').")
+    else:
+        logging.info(f"EC2 instance {instance_id} state: {result['instance_state']}")
+    return result
+
+def _describe_load_balancers(elbv2, lb_dns_name, lb_name=None, lb_arn=None):
+    """
+    Looks up the ALB by ARN or name when known, otherwise scans all ALBs page by page.
+    Returns:
+        dict: The matching load balancer, or None if not found.
+    """
+    if lb_arn or lb_name:
+        kwargs = {"LoadBalancerArns": [lb_arn]} if lb_arn else {"Names": [lb_name]}
+        lbs = elbv2.describe_load_balancers(**kwargs)["LoadBalancers"]
+        return next((lb for lb in lbs if lb["DNSName"] == lb_dns_name), None)
+
+    for page in elbv2.get_paginator("describe_load_balancers").paginate():
+        lb_found = next((lb for lb in page["LoadBalancers"] if lb["DNSName"] == lb_dns_name), None)
+        if lb_found:
+            return lb_found
+    return None
+
+def validate_aws_resources(instance_id, lb_dns_name, region="us-east-2", lb_name=None, lb_arn=None):
     """
     Validates that the EC2 instance and ALB exist and are configured correctly.
     Args:
         instance_id (str): EC2 instance ID to check.
         lb_dns_name (str): DNS name of the ALB.
         region (str): AWS region.
+        lb_name (str): Optional ALB name, used to query the ALB directly.
+        lb_arn (str): Optional ALB ARN, used to query the ALB directly.
     Returns:
         dict: Validation results.
     """
-    ec2 = boto3.client("ec2", region_name=region)
-    elbv2 = boto3.client("elbv2", region_name=region)
+    from botocore.exceptions import ClientError
+    ec2 = _client("ec2", region)
+    elbv2 = _client("elbv2", region)
     result = {
         "instance_id": None,
         "instance_state": None,
@@ -53,26 +168,19 @@ def validate_aws_resources(instance_id, lb_dns_name, region="us-east-2"):
         "load_balancer_dns": None
     }
 
+    # The EC2 and ELBv2 lookups are independent, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ec2_future = executor.submit(_describe_instances, ec2, [instance_id])
+        lb_future = executor.submit(_describe_load_balancers, elbv2, lb_dns_name, lb_name, lb_arn)
+
     try:
-        resp = ec2.describe_instances(InstanceIds=[instance_id])
-        reservations = resp.get("Reservations", [])
-        if reservations and reservations[0]["Instances"]:
-            instance = reservations[0]["Instances"][0]
-            result["instance_id"] = instance.get("InstanceId")
-            result["instance_state"] = instance.get("State", {}).get("Name")
-            result["public_ip"] = instance.get("PublicIpAddress")
-            if result["instance_state"] != "running":
-                logging.warning(f"Instance {instance_id} is in state: {result['instance_state']} (expected 'running').")
-            else:
-                logging.info(f"EC2 instance {instance_id} state: {result['instance_state']}")
-        else:
-            logging.error(f"Instance {instance_id} not found.")
+        instances = ec2_future.result()
+        result.update(_instance_result(instance_id, instances.get(instance_id)))
     except ClientError as e:
         logging.error(f"Error fetching EC2 instance: {e}")
 
     try:
-        lbs = elbv2.describe_load_balancers()["LoadBalancers"]
-        lb_found = next((lb for lb in lbs if lb["DNSName"] == lb_dns_name), None)
+        lb_found = lb_future.result()
         if lb_found:
             result["load_balancer_dns"] = lb_found["DNSName"]
             logging.info(f"Load balancer found: {lb_found['DNSName']}")
@@ -83,6 +191,27 @@ def validate_aws_resources(instance_id, lb_dns_name, region="us-east-2"):
 
     return result
 
+def validate_instances(instance_ids, region="us-east-2"):
+    """
+    Validates many EC2 instances, batching them into as few DescribeInstances calls as possible.
+    Args:
+        instance_ids (list): EC2 instance IDs to check.
+        region (str): AWS region.
+    Returns:
+        dict: Validation results keyed by instance ID.
+    """
+    from botocore.exceptions import ClientError
+    instance_ids = list(instance_ids)
+    try:
+        instances = _describe_instances(_client("ec2", region), instance_ids)
+    except ClientError as e:
+        logging.error(f"Error fetching EC2 instances: {e}")
+        instances = {}
+    return {
+        instance_id: _instance_result(instance_id, instances.get(instance_id))
+        for instance_id in instance_ids
+    }
+
 def save_validation_json(data, path="aws_validation.json"):
     """
     Saves the validation results to a JSON file.
@@ -91,22 +220,26 @@ def save_validation_json(data, path="aws_validation.json"):
         path (str): Output file path.
     """
     try:
-        with open(path, "w") as f:
-            json.dump(data, f, indent=4)
+        # Both paths write the same 2-space indented layout
+        if orjson is not None:
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, "w") as f:
+                json.dump(data, f, indent=2)
         logging.info(f"Validation results saved to {path}")
     except Exception as e:
         logging.error(f"Failed to save validation json: {e}")
 
-def main():
+def validate_outputs(outputs, region="us-east-2"):
     """
-    Main function to perform validation and save results.
+    Validates the deployed resources described by the Terraform outputs and saves the results.
+    Failures are logged rather than raised.
+    Args:
+        outputs (dict): Terraform output keys and values.
+        region (str): AWS region.
     """
-    logging.basicConfig(level=logging.INFO)
     try:
-        generated_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "generated")
-        outputs = get_terraform_outputs(generated_dir)
-        logging.info(f"Terraform Outputs: {outputs}")
-
         instance_id = outputs.get("instance_id")
         lb_dns_name = outputs.get("load_balancer_dns")
 
@@ -114,10 +247,25 @@ def main():
             logging.error("Missing instance_id or load_balancer_dns in terraform outputs.")
             return
 
-        validation_results = validate_aws_resources(instance_id, lb_dns_name)
+        validation_results = validate_aws_resources(
+            instance_id,
+            lb_dns_name,
+            region=region,
+            lb_name=outputs.get("load_balancer_name"),
+            lb_arn=outputs.get("load_balancer_arn")
+        )
         save_validation_json(validation_results)
     except Exception as e:
         logging.error(f"Validation failed: {e}")
 
+def main():
+    """
+    Main function to perform validation and save results.
+    """
+    logging.basicConfig(level=logging.INFO)
+    outputs = get_terraform_outputs(_GENERATED_DIR)
+    logging.info(f"Terraform Outputs: {outputs}")
+    validate_outputs(outputs)
+
 if __name__ == "__main__":
     main()
@@ -2,6 +2,7 @@ import logging
 from scripts.user_input import get_user_input
 from scripts.render_template import render_template
 from scripts.terraform_runner import run_terraform
+from aws_validator import parse_terraform_outputs, validate_outputs
 
 class AWSAutomationProject:
     """
@@ -9,6 +10,7 @@ class AWSAutomationProject:
     - Collect user input
     - Render Terraform configuration using Jinja2
     - Run Terraform (init, plan, apply)
+    - Validate the deployed resources with boto3
     """
 
     def __init__(self):
@@ -35,6 +37,15 @@ class AWSAutomationProject:
         """Run Terraform (init, plan, apply) and capture outputs."""
         self.terraform_output = run_terraform()
 
+    def validate_resources(self):
+        """Validate the deployed resources using the outputs captured from Terraform."""
+        try:
+            outputs = parse_terraform_outputs(self.terraform_output)
+        except Exception as e:
+            logging.error(f"Failed to parse terraform outputs: {e}")
+            return
+        validate_outputs(outputs, region=self.config.region)
+
     def run(self):
         """Run the main project workflow with error handling."""
         try:
@@ -53,6 +64,8 @@ class AWSAutomationProject:
             logging.info("Terraform Output:")
             logging.info(self.terraform_output)
 
+            self.validate_resources()
+
         except Exception as e:
             logging.error(f"An error occurred: {str(e)}")
             raise
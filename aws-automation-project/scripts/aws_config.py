@@ -5,12 +5,63 @@ Defines AWSConfig dataclass for EC2/ALB deployment,
 input validation, and user prompt logic for the automation project.
 """
 
-import re
+import os
+import json
+import time
+import logging
+from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
 
 DEFAULT_REGION = "us-east-2"
 
+_AWS_REGIONS = frozenset({"us-east-1", "us-east-2", "us-west-1", "us-west-2"})
+
+_AZ_CACHE_TTL = 86400  # seconds
+_AZ_FAILURE_TTL = 300  # seconds
+
+def _is_fresh(path: Path, ttl: int) -> bool:
+    """Return True if the file exists and was written less than ttl seconds ago."""
+    return path.exists() and time.time() - path.stat().st_mtime < ttl
+
+def _get_azs(region: str) -> list:
+    """
+    Return the availability zone names for a region.
+    Results are cached on disk for a day to avoid a DescribeAvailabilityZones
+    call on every run. A failed lookup is only remembered for a few minutes,
+    so runs without AWS credentials do not retry it at every prompt.
+    Returns an empty list if the lookup fails.
+    """
+    path = failed_path = None
+    try:
+        cache_dir = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "aws_automation"
+        path = cache_dir / f"azs-{region}.json"
+        failed_path = cache_dir / f"azs-{region}.failed"
+        if _is_fresh(path, _AZ_CACHE_TTL):
+            return json.loads(path.read_text())
+        if _is_fresh(failed_path, _AZ_FAILURE_TTL):
+            return []
+    except (OSError, RuntimeError, ValueError):
+        pass
+
+    try:
+        import boto3
+        zones = boto3.client("ec2", region_name=region).describe_availability_zones()["AvailabilityZones"]
+        azs = [zone["ZoneName"] for zone in zones]
+    except Exception as e:
+        logging.warning(f"Could not look up availability zones for {region}: {e}")
+        cache_path, contents, azs = failed_path, "", []
+    else:
+        cache_path, contents = path, json.dumps(azs)
+
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(contents)
+        except OSError as e:
+            logging.warning(f"Could not cache availability zones: {e}")
+    return azs
+
 class InstanceType(str, Enum):
     SMALL = "t3.small"
     MEDIUM = "t3.medium"
@@ -23,11 +74,11 @@ class ValidationError(Exception):
     """Raised when input validation fails."""
     pass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AWSConfig:
     """Configuration class for AWS resources."""
-    ami: AMIType
-    instance_type: InstanceType
+    ami: str
+    instance_type: str
     region: str
     availability_zone: str
     lb_name: str
@@ -41,26 +92,32 @@ class AWSConfig:
             return False
         if name.startswith('-') or name.endswith('-'):
             return False
-        if not re.match('^[a-zA-Z0-9-]+$', name):
-            return False
-        aws_regions = ["us-east-1", "us-east-2", "us-west-1", "us-west-2"]
-        if name.lower() in aws_regions:
+        if name.lower() in _AWS_REGIONS:
             print("Load balancer name cannot be an AWS region name")
             return False
+        # Only ASCII letters, digits and hyphens are allowed
+        if not (name.isascii() and name.replace('-', '').isalnum()):
+            return False
         return True
 
     @staticmethod
     def _get_validated_input(prompt: str, options: dict, default: str):
-        """Get and validate user input against a set of options."""
+        """
+        Get and validate user input against a set of options.
+        An empty answer selects the default; anything else invalid is asked again.
+        """
+        menu = "\n".join(f"{key} - {name}" for key, (name, _) in options.items())
+        choice_prompt = f"Enter your choice [{'/'.join(options.keys())}] (default {default}): "
         while True:
             print(f"\n{prompt}")
-            for key, (name, _) in options.items():
-                print(f"{key} - {name}")
-            choice = input(f"Enter your choice [{'/'.join(options.keys())}]: ").strip()
+            print(menu)
+            choice = input(choice_prompt).strip()
+            if not choice:
+                print(f"Using default: {options[default][0]}")
+                return options[default]
             if choice in options:
                 return options[choice]
-            print(f"Invalid choice. Using default: {options[default][0]}")
-            return options[default]
+            print("Invalid choice. Please try again.")
 
     @classmethod
     def from_user_input(cls) -> "AWSConfig":
@@ -98,7 +155,11 @@ class AWSConfig:
         print(f"\nUsing region: {region} (only supported region)")
 
         # Availability Zone
+        # Kept fixed because the template pins the instance to a subnet in this zone
         availability_zone = f"{region}a"
+        azs = _get_azs(region)
+        if azs and availability_zone not in azs:
+            logging.warning(f"Availability zone {availability_zone} is not listed for {region}: {', '.join(azs)}")
         print(f"Using availability zone: {availability_zone}")
 
         # Load Balancer Name with improved validation
@@ -112,8 +173,8 @@ class AWSConfig:
             print("- Not begin or end with a hyphen")
 
         return cls(
-            ami=ami,
-            instance_type=instance_type,
+            ami=ami.value,
+            instance_type=instance_type.value,
             region=region,
             availability_zone=availability_zone,
             lb_name=lb_name
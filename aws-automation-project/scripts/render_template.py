@@ -7,7 +7,25 @@ based on user-provided AWSConfig.
 
 import os
 import logging
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+from functools import lru_cache
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, TemplateNotFound
+
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_TEMPLATES_DIR = os.path.join(_BASE_DIR, "Templates")
+_GENERATED_DIR = os.path.join(_BASE_DIR, "generated")
+
+@lru_cache(maxsize=None)
+def _get_env(templates_dir):
+    """
+    Return the Jinja2 environment for a templates directory, creating it on first use.
+    Shared across calls so compiled templates are reused instead of reparsed.
+    """
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        auto_reload=False,
+        cache_size=50,
+        bytecode_cache=FileSystemBytecodeCache()
+    )
 
 def render_template(config):
     """
@@ -17,16 +35,11 @@ def render_template(config):
         config (AWSConfig): Configuration object with AWS settings
     """
     try:
-        # Get absolute paths
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        templates_dir = os.path.join(base_dir, "Templates")
-        generated_dir = os.path.join(base_dir, "generated")
-
         # Ensure the generated directory exists
-        os.makedirs(generated_dir, exist_ok=True)
+        os.makedirs(_GENERATED_DIR, exist_ok=True)
 
-        # Create Jinja2 environment
-        env = Environment(loader=FileSystemLoader(templates_dir))
+        # Get the shared Jinja2 environment
+        env = _get_env(_TEMPLATES_DIR)
 
         # Load and render template
         try:
@@ -37,8 +50,8 @@ def render_template(config):
 
         rendered_tf = template.render(
             region=config.region,
-            ami=config.ami.value,
-            instance_type=config.instance_type.value,
+            ami=config.ami,
+            instance_type=config.instance_type,
             availability_zone=config.availability_zone,
             load_balancer_name=config.lb_name,
             environment="dev",  # Default values for new template parameters
@@ -46,7 +59,7 @@ def render_template(config):
         )
 
         # Save rendered template
-        output_path = os.path.join(generated_dir, "main.tf")
+        output_path = os.path.join(_GENERATED_DIR, "main.tf")
         with open(output_path, "w") as f:
             f.write(rendered_tf)
 
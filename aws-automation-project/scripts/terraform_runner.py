@@ -6,66 +6,108 @@ including init, plan, apply, output, and destroy,
 with robust error handling and live progress display.
 """
 
+import io
 import os
+import re
+import time
+import codecs
 import shutil
 import logging
+import selectors
 import subprocess
+from collections import namedtuple
+
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_GENERATED_DIR = os.path.join(_BASE_DIR, "generated")
+
+# Resolved path of the terraform binary, cached by check_terraform_installed
+_TERRAFORM_BIN = None
+
+CommandResult = namedtuple("CommandResult", ["returncode", "stdout", "stderr"])
+
+# Terraform log markers shown as live progress indicators
+_PROGRESS_ICONS = {
+    "Creating...": "🔄",
+    "Modifying...": "🔄",
+    "Destroying...": "🔄",
+    "Creation complete": "✅",
+    "Modifications complete": "✅",
+    "Destruction complete": "✅",
+    "Error:": "❌",
+}
+_PROGRESS_RE = re.compile("(" + "|".join(map(re.escape, _PROGRESS_ICONS)) + ")")
 
 def check_terraform_installed():
-    """Check if Terraform is installed and accessible."""
-    if not shutil.which("terraform"):
+    """
+    Check if Terraform is installed and accessible.
+    Returns:
+        str: Absolute path of the terraform binary, resolved once per process.
+    """
+    global _TERRAFORM_BIN
+    if _TERRAFORM_BIN is None:
+        _TERRAFORM_BIN = shutil.which("terraform")
+    if not _TERRAFORM_BIN:
         raise RuntimeError(
             "Terraform is not installed or not in PATH. "
             "Please install Terraform and try again."
         )
+    return _TERRAFORM_BIN
 
 def run_command(command, working_dir, timeout=300):
     """
     Run a command in a given working directory and return its output.
     Shows real-time progress with visual indicators.
     """
+    process = None
     try:
         process = subprocess.Popen(
             command,
             cwd=working_dir,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
-            universal_newlines=True
+            stderr=subprocess.PIPE
         )
 
         logging.info(f"Running command: {' '.join(command)}")
         print("Progress: ", end="", flush=True)
 
-        stdout_lines = []
-        stderr_lines = []
-        while True:
-            stdout_line = process.stdout.readline()
-            stderr_line = process.stderr.readline()
-
-            if stdout_line:
-                stdout_lines.append(stdout_line)
-                if "Creating..." in stdout_line or "Modifying..." in stdout_line:
-                    print("🔄", end="", flush=True)
-                elif "Creation complete" in stdout_line or "Modifications complete" in stdout_line:
-                    print("✅", end="", flush=True)
-            if stderr_line:
-                stderr_lines.append(stderr_line)
-                if "Error:" in stderr_line:
-                    print("❌", end="", flush=True)
-            if not stdout_line and not stderr_line and process.poll() is not None:
-                break
+        decoders = {
+            name: codecs.getincrementaldecoder("utf-8")(errors="replace")
+            for name in ("stdout", "stderr")
+        }
+        pending = {"stdout": "", "stderr": ""}
+        buffers = {"stdout": io.StringIO(), "stderr": io.StringIO()}
+        deadline = time.monotonic() + timeout
+
+        # Drain both pipes as data arrives so neither stream can block the other
+        with selectors.DefaultSelector() as selector:
+            selector.register(process.stdout, selectors.EVENT_READ, "stdout")
+            selector.register(process.stderr, selectors.EVENT_READ, "stderr")
+
+            while selector.get_map():
+                if time.monotonic() > deadline:
+                    raise subprocess.TimeoutExpired(command, timeout)
+                for key, _ in selector.select(timeout=0.1):
+                    data = os.read(key.fd, 4096)
+                    if not data:
+                        selector.unregister(key.fileobj)
+                    text = pending[key.data] + decoders[key.data].decode(data, final=not data)
+                    # Hold back a trailing partial line until the rest of it arrives
+                    cut = max(text.rfind("\n"), text.rfind("\r")) + 1 if data else len(text)
+                    pending[key.data], text = text[cut:], text[:cut]
+
+                    buffers[key.data].write(text)
+                    for match in _PROGRESS_RE.finditer(text):
+                        print(_PROGRESS_ICONS[match.group(1)], end="", flush=True)
 
         logging.info("")  # New line after progress indicators
 
-        process.wait(timeout=timeout)
+        process.wait(timeout=max(deadline - time.monotonic(), 0))
 
-        result = type('Result', (), {
-            'returncode': process.returncode,
-            'stdout': ''.join(stdout_lines),
-            'stderr': ''.join(stderr_lines)
-        })
+        result = CommandResult(
+            process.returncode,
+            buffers["stdout"].getvalue(),
+            buffers["stderr"].getvalue()
+        )
 
         if result.stdout:
             logging.info(f"Command output:\n{result.stdout}")
@@ -76,9 +118,42 @@ def run_command(command, working_dir, timeout=300):
 
     except subprocess.TimeoutExpired:
         process.kill()
+        process.wait()
         raise Exception(f"Command timed out after {timeout} seconds: {' '.join(command)}")
     except Exception as e:
         raise Exception(f"Command failed: {' '.join(command)}\nError: {str(e)}")
+    finally:
+        if process is not None:
+            process.stdout.close()
+            process.stderr.close()
+
+def run_command_quiet(command, working_dir, timeout=60):
+    """
+    Run a short command with bounded output and return its result.
+    Unlike run_command, output is collected in one go without live progress.
+    """
+    logging.info(f"Running command: {' '.join(command)}")
+    try:
+        process = subprocess.run(
+            command,
+            cwd=working_dir,
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        raise Exception(f"Command timed out after {timeout} seconds: {' '.join(command)}")
+    except Exception as e:
+        raise Exception(f"Command failed: {' '.join(command)}\nError: {str(e)}")
+
+    result = CommandResult(process.returncode, process.stdout, process.stderr)
+
+    if result.stdout:
+        logging.info(f"Command output:\n{result.stdout}")
+    if result.stderr:
+        logging.error(f"Command error:\n{result.stderr}")
+
+    return result
 
 def run_terraform():
     """
@@ -88,38 +163,37 @@ def run_terraform():
     Raises:
         Exception: If any Terraform command fails.
     """
-    check_terraform_installed()
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    generated_dir = os.path.join(base_dir, "generated")
-
-    logging.info(f"Working directory: {generated_dir}")
+    terraform = check_terraform_installed()
+    logging.info(f"Working directory: {_GENERATED_DIR}")
 
     try:
         logging.info("\nInitializing Terraform...")
-        init_result = run_command(["terraform", "init"], generated_dir, timeout=60)
+        init_result = run_command_quiet([terraform, "init"], _GENERATED_DIR, timeout=60)
         if init_result.returncode != 0:
             raise Exception("Terraform init failed")
 
         logging.info("\nPlanning Terraform changes...")
-        plan_result = run_command(["terraform", "plan", "-out=tfplan"], generated_dir, timeout=120)
+        plan_result = run_command([terraform, "plan", "-out=tfplan"], _GENERATED_DIR, timeout=120)
         if plan_result.returncode != 0:
             raise Exception("Terraform plan failed")
 
-        if "No changes" not in plan_result.stdout:
+        # The plan output already summarises the changes; only render the
+        # full plan (an extra terraform process) when explicitly requested
+        if os.environ.get("TF_SHOW_PLAN") and "No changes" not in plan_result.stdout:
             logging.info("\nShowing detailed plan...")
-            show_result = run_command(["terraform", "show", "tfplan"], generated_dir, timeout=30)
+            show_result = run_command_quiet([terraform, "show", "tfplan"], _GENERATED_DIR, timeout=30)
             if show_result.returncode != 0:
                 raise Exception("Failed to show plan")
 
         logging.info("\nApplying Terraform changes...")
         logging.info("This might take a few minutes as resources are being created...")
-        apply_result = run_command(["terraform", "apply", "-auto-approve"], generated_dir, timeout=600)
+        apply_result = run_command([terraform, "apply", "-auto-approve"], _GENERATED_DIR, timeout=600)
         if apply_result.returncode != 0:
             raise Exception("Terraform apply failed")
 
         logging.info("\n✨ Deployment completed successfully! ✨")
 
-        output_result = run_command(["terraform", "output", "-json"], generated_dir, timeout=30)
+        output_result = run_command_quiet([terraform, "output", "-json"], _GENERATED_DIR, timeout=30)
         return output_result.stdout if output_result.returncode == 0 else "{}"
 
     except Exception as e:
@@ -130,28 +204,11 @@ def destroy_infrastructure():
     """
     Run Terraform destroy to remove all deployed resources.
     """
-    check_terraform_installed()
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    generated_dir = os.path.join(base_dir, "generated")
+    terraform = check_terraform_installed()
 
     try:
-        process = subprocess.Popen(
-            ["terraform", "destroy", "-auto-approve"],
-            cwd=generated_dir,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        print("Destroy Progress: ", end="", flush=True)
-        while True:
-            output = process.stdout.readline()
-            if output:
-                print(output.strip())
-            elif process.poll() is not None:
-                break
-
-        process.wait()
-        if process.returncode != 0:
+        destroy_result = run_command([terraform, "destroy", "-auto-approve"], _GENERATED_DIR, timeout=600)
+        if destroy_result.returncode != 0:
             logging.error("Terraform destroy failed.")
             raise Exception("Terraform destroy failed.")
         logging.info("All resources destroyed successfully.")